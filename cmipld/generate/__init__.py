@@ -55,10 +55,13 @@ try:
         get_folders_from_branch,
         get_json_files_from_branch,
         get_file_content_from_branch,
+        get_file_contents_from_branch,
+        clear_branch_cache,
         DATA_BRANCH,
         # Template field utilities
         get_template_fields_and_options,
         find_matching_option,
+        build_option_index,
         extract_value,
         normalize_value,
         # Configuration utilities
@@ -79,8 +82,11 @@ except ImportError:
     get_folders_from_branch = None
     get_json_files_from_branch = None
     get_file_content_from_branch = None
+    get_file_contents_from_branch = None
+    clear_branch_cache = None
     get_template_fields_and_options = None
     find_matching_option = None
+    build_option_index = None
     extract_value = None
     normalize_value = None
     load_template_config = None
@@ -110,10 +116,13 @@ __all__ = [
     'get_folders_from_branch', 
     'get_json_files_from_branch',
     'get_file_content_from_branch',
+    'get_file_contents_from_branch',
+    'clear_branch_cache',
     'DATA_BRANCH',
     # Template utilities - Field handling
     'get_template_fields_and_options',
     'find_matching_option',
+    'build_option_index',
     'extract_value',
     'normalize_value',
     # Template utilities - Configuration
@@ -9,10 +9,19 @@ pip install python-docx
 
 """
 
+import copy
 import csv
+import io
+import os
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
+from xml.sax.saxutils import escape
+from zipfile import ZipFile
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
@@ -20,14 +29,61 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.shared import OxmlElement, qn
 from docx.oxml.ns import nsdecls
 from docx.oxml import parse_xml
+from docx.opc import phys_pkg
+from docx.text.paragraph import Paragraph
 
-failed_templates = []
+# Font sizes and indents shared by every generated document
+TITLE_SIZE = Pt(18)
+HEADING_1_SIZE = Pt(16)
+HEADING_2_SIZE = Pt(14)
+FIELD_LABEL_SIZE = Pt(12)
+FIELD_DESCRIPTION_SIZE = Pt(11)
+FIELD_LABEL_SPACE_AFTER = Pt(6)
+FIELD_DESCRIPTION_SPACE_AFTER = Pt(12)
+FIELD_DESCRIPTION_INDENT = Inches(0.25)
+OPTION_INDENT = Inches(0.5)
+
+# Options appended to 'dict_with_extra' dropdowns
+EXTRA_LICENCE_OPTIONS = ("Open Source", "Registration Required", "Proprietary")
+
+# Filling instructions by field type, and for (optional, required) fields
+FIELD_TYPE_INSTRUCTIONS = {
+    'input': "Enter a single line of text",
+    'textarea': "Enter multiple lines of text",
+    'dropdown': "Select one option from the dropdown list",
+    'multi-select': "Select multiple options from the list (hold Ctrl/Cmd to select multiple)",
+    'checkboxes': "Check one or more boxes",
+}
+REQUIRED_INSTRUCTIONS = ("This field is optional", "This field is required and must be filled")
+
+# Field types whose options are listed in the guide
+OPTION_FIELD_TYPES = frozenset(('dropdown', 'multi-select'))
+
+# Paragraph styles assigned while building a guide
+DOCUMENT_STYLE_NAMES = ('Title', 'Heading 1', 'Heading 2', 'Field Label', 'Field Description')
+
+# Paragraph markup for an empty paragraph in a given style
+STYLED_PARAGRAPH_XML = '<w:p {nsdecls}><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr></w:p>'
+
+# Paragraph markup for a single option bullet
+OPTION_BULLET_XML = (
+    '<w:p><w:pPr><w:pStyle w:val="{style_id}"/><w:ind w:left="{indent}"/></w:pPr>'
+    '<w:r><w:t xml:space="preserve">• {text}</w:t></w:r></w:p>'
+)
+
+# Write buffer for saved guides, so the zip writer's many small writes coalesce
+SAVE_BUFFER_SIZE = 1 << 20
+
+@lru_cache(maxsize=None)
+def _compile_template_source(py_file, mtime):
+    """Compile a template Python file, cached on its path and modification time."""
+    return compile(Path(py_file).read_text(encoding='utf-8'), py_file, 'exec')
 
 def load_template_data(py_file):
     """Load configuration and data from Python file."""
     namespace = {}
-    with open(py_file, 'r', encoding='utf-8') as f:
-        exec(f.read(), namespace)
+    code = _compile_template_source(str(py_file), os.path.getmtime(py_file))
+    exec(code, namespace)
     
     config = namespace.get('TEMPLATE_CONFIG', {})
     data = namespace.get('DATA', {})
@@ -35,13 +91,29 @@ def load_template_data(py_file):
 
 def load_csv_fields(csv_file):
     """Load field definitions from CSV."""
-    fields = []
     with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader)
+        width = len(header)
+        order_index = header.index('field_order')
+        
+        rows = []
         for row in reader:
-            fields.append(row)
+            if not row:
+                continue
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            rows.append((int(row[order_index]), row))
     
-    fields.sort(key=lambda x: int(x['field_order']))
+    rows.sort(key=itemgetter(0))
+    
+    fields = []
+    for _, row in rows:
+        field = dict(zip(header, row))
+        # Literal "\n" sequences in the CSV become real line breaks once, here
+        field['description'] = field['description'].replace('\\n', '\n')
+        field['required'] = field['required'].strip().lower() == 'true'
+        fields.append(field)
     return fields
 
 def setup_document_styles(doc):
@@ -53,7 +125,7 @@ def setup_document_styles(doc):
     except KeyError:
         title_style = doc.styles.add_style('Title', WD_STYLE_TYPE.PARAGRAPH)
     title_style.font.name = 'Calibri'
-    title_style.font.size = Pt(18)
+    title_style.font.size = TITLE_SIZE
     title_style.font.bold = True
     
     # Heading 1 style
@@ -62,7 +134,7 @@ def setup_document_styles(doc):
     except KeyError:
         h1_style = doc.styles.add_style('Heading 1', WD_STYLE_TYPE.PARAGRAPH)
     h1_style.font.name = 'Calibri'
-    h1_style.font.size = Pt(16)
+    h1_style.font.size = HEADING_1_SIZE
     h1_style.font.bold = True
     h1_style.font.color.rgb = None  # Default color
     
@@ -72,7 +144,7 @@ def setup_document_styles(doc):
     except KeyError:
         h2_style = doc.styles.add_style('Heading 2', WD_STYLE_TYPE.PARAGRAPH)
     h2_style.font.name = 'Calibri'
-    h2_style.font.size = Pt(14)
+    h2_style.font.size = HEADING_2_SIZE
     h2_style.font.bold = True
     
     # Field Label style
@@ -81,9 +153,9 @@ def setup_document_styles(doc):
     except KeyError:
         field_label_style = doc.styles.add_style('Field Label', WD_STYLE_TYPE.PARAGRAPH)
     field_label_style.font.name = 'Calibri'
-    field_label_style.font.size = Pt(12)
+    field_label_style.font.size = FIELD_LABEL_SIZE
     field_label_style.font.bold = True
-    field_label_style.paragraph_format.space_after = Pt(6)
+    field_label_style.paragraph_format.space_after = FIELD_LABEL_SPACE_AFTER
     
     # Field Description style
     try:
@@ -91,19 +163,62 @@ def setup_document_styles(doc):
     except KeyError:
         field_desc_style = doc.styles.add_style('Field Description', WD_STYLE_TYPE.PARAGRAPH)
     field_desc_style.font.name = 'Calibri'
-    field_desc_style.font.size = Pt(11)
-    field_desc_style.paragraph_format.space_after = Pt(12)
-    field_desc_style.paragraph_format.left_indent = Inches(0.25)
+    field_desc_style.font.size = FIELD_DESCRIPTION_SIZE
+    field_desc_style.paragraph_format.space_after = FIELD_DESCRIPTION_SPACE_AFTER
+    field_desc_style.paragraph_format.left_indent = FIELD_DESCRIPTION_INDENT
+
+@lru_cache(maxsize=None)
+def _base_document_bytes():
+    """Serialise an empty document with the custom styles applied, built once per process."""
+    doc = Document()
+    setup_document_styles(doc)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
 
-def add_field_to_document(doc, field_def, data, field_number):
+def new_styled_document():
+    """Create a new document that already carries the custom styles."""
+    return Document(io.BytesIO(_base_document_bytes()))
+
+def get_document_styles(doc):
+    """Resolve the paragraph styles used by the guide once, keyed by style name."""
+    return {name: doc.styles[name] for name in DOCUMENT_STYLE_NAMES}
+
+def _append_block(doc, element):
+    """Append a block element to the body, ahead of its trailing section properties."""
+    body = doc.element.body
+    sect_pr = body.sectPr
+    if sect_pr is not None:
+        sect_pr.addprevious(element)
+    else:
+        body.append(element)
+
+@lru_cache(maxsize=None)
+def _styled_paragraph_template(style_id):
+    """Parse an empty paragraph carrying ``style_id`` once; callers deep-copy it."""
+    return parse_xml(STYLED_PARAGRAPH_XML.format(nsdecls=nsdecls('w'), style_id=style_id))
+
+def add_styled_paragraph(doc, style, text=None):
+    """Append a paragraph in ``style``, copied from a pre-parsed template."""
+    p = copy.deepcopy(_styled_paragraph_template(style.style_id))
+    _append_block(doc, p)
+    paragraph = Paragraph(p, doc._body)
+    if text:
+        paragraph.add_run(text)
+    return paragraph
+
+def add_field_to_document(doc, field_def, data, field_number, styles=None):
     """Add a single field to the Word document."""
     
+    if styles is None:
+        styles = get_document_styles(doc)
+    
     field_type = field_def['field_type']
     field_id = field_def['field_id']
     label = field_def['label']
     description = field_def['description']
     data_source = field_def['data_source']
-    required = field_def['required'].lower() == 'true'
+    required = field_def['required']
     placeholder = field_def['placeholder']
     options_type = field_def['options_type']
     default_value = field_def['default_value']
@@ -112,10 +227,7 @@ def add_field_to_document(doc, field_def, data, field_number):
     if field_type == 'markdown':
         # Add markdown content as informational text
         if description:
-            p = doc.add_paragraph()
-            p.style = 'Field Description'
-            formatted_desc = description.replace('\\n', '\n')
-            p.add_run(formatted_desc)
+            add_styled_paragraph(doc, styles['Field Description'], description)
             doc.add_paragraph()  # Add spacing
         return
     
@@ -124,157 +236,168 @@ def add_field_to_document(doc, field_def, data, field_number):
     if required:
         field_header += " *"
     
-    p = doc.add_paragraph(field_header)
-    p.style = 'Field Label'
+    add_styled_paragraph(doc, styles['Field Label'], field_header)
     
     # Field type and ID info
     type_info = f"Field Type: {field_type.title()}"
     if field_id:
         type_info += f" | Field ID: {field_id}"
     
-    p = doc.add_paragraph(type_info)
-    p.style = 'Field Description'
-    run = p.runs[0]
-    run.italic = True
+    details = []
     
     # Description
     if description and description.strip():
-        formatted_desc = description.replace('\\n', '\n')
-        p = doc.add_paragraph(f"Description: {formatted_desc}")
-        p.style = 'Field Description'
+        details.append(f"Description: {description}")
     
     # Placeholder information
     if field_type in ['input', 'textarea'] and placeholder:
-        p = doc.add_paragraph(f"Placeholder text: \"{placeholder}\"")
-        p.style = 'Field Description'
+        details.append(f"Placeholder text: \"{placeholder}\"")
     
     # Default value
     if default_value:
-        p = doc.add_paragraph(f"Default value: {default_value}")
-        p.style = 'Field Description'
+        details.append(f"Default value: {default_value}")
+    
+    # Type info and the details above share one paragraph, separated by line breaks
+    p = add_styled_paragraph(doc, styles['Field Description'])
+    run = p.add_run(type_info)
+    run.italic = True
+    for detail in details:
+        run.add_break()
+        run = p.add_run(detail)
     
     # Options for dropdowns and multi-selects
-    if field_type in ['dropdown', 'multi-select']:
+    if field_type in OPTION_FIELD_TYPES:
         options = get_field_options(field_def, data)
         
         if options:
             if field_type == 'multi-select':
-                p = doc.add_paragraph("Available options (multiple selections allowed):")
+                options_intro = "Available options (multiple selections allowed):"
             else:
-                p = doc.add_paragraph("Available options:")
-            p.style = 'Field Description'
+                options_intro = "Available options:"
+            add_styled_paragraph(doc, styles['Field Description'], options_intro)
             
             # Create a bulleted list of options
-            for option in options:
-                p = doc.add_paragraph(f"• {option}")
-                p.style = 'Field Description'
-                p.paragraph_format.left_indent = Inches(0.5)
+            add_option_bullets(doc, options, styles['Field Description'])
     
     # Filling instructions
     instructions = get_filling_instructions(field_type, required, field_def, data)
     if instructions:
-        p = doc.add_paragraph(f"How to fill: {instructions}")
-        p.style = 'Field Description'
-        run = p.runs[0]
+        p = add_styled_paragraph(doc, styles['Field Description'])
+        run = p.add_run(f"How to fill: {instructions}")
         run.font.bold = True
     
     # Add spacing between fields
     doc.add_paragraph()
 
+def add_option_bullets(doc, options, style):
+    """Append indented '• option' paragraphs for all options with a single XML parse."""
+    style_id = style.style_id
+    paragraphs = ''.join(
+        OPTION_BULLET_XML.format(style_id=style_id, indent=OPTION_INDENT.twips, text=escape(str(option)))
+        for option in options
+    )
+    container = parse_xml(f'<w:body {nsdecls("w")}>{paragraphs}</w:body>')
+    for p in list(container):
+        _append_block(doc, p)
+
 def get_field_options(field_def, data):
-    """Extract options for dropdown and multi-select fields."""
+    """
+    Extract options for dropdown and multi-select fields.
+    
+    The source keys view or list is returned as-is where no extra options are
+    needed, so callers should only iterate over or test the result.
+    """
     data_source = field_def['data_source']
-    options_type = field_def['options_type']
-    field_id = field_def['field_id']
+    if data_source == 'none' or data_source not in data:
+        return []
     
-    options = []
+    source_data = data[data_source]
+    options_type = field_def['options_type']
     
-    if data_source != 'none' and data_source in data:
-        source_data = data[data_source]
-        
-        if options_type == 'dict_keys':
-            options = list(source_data.keys())
-        elif options_type == 'list':
-            options = list(source_data)
-        elif options_type in ['dict_multiple']:
-            options = list(source_data.keys())
-        elif options_type == 'dict_with_extra':
-            options = list(source_data.keys())
-            options.extend(["Open Source", "Registration Required", "Proprietary"])
-        elif options_type == 'list_with_na':
-            options = ["Not applicable"] + list(source_data)
-    
-    return options
+    if options_type == 'dict_keys':
+        return source_data.keys()
+    elif options_type == 'list':
+        return source_data
+    elif options_type in ['dict_multiple']:
+        return source_data.keys()
+    elif options_type == 'dict_with_extra':
+        return [*source_data.keys(), *EXTRA_LICENCE_OPTIONS]
+    elif options_type == 'list_with_na':
+        return ["Not applicable", *source_data]
+    
+    return []
 
 def get_filling_instructions(field_type, required, field_def, data):
     """Generate filling instructions based on field type."""
+    return _filling_instructions(field_type, required, field_def.get('placeholder', ''))
+
+@lru_cache(maxsize=512)
+def _filling_instructions(field_type, required, placeholder):
+    """Build the instruction text; field schemas repeat heavily across templates."""
     
-    instructions = []
-    
-    if field_type == 'input':
-        instructions.append("Enter a single line of text")
-    elif field_type == 'textarea':
-        instructions.append("Enter multiple lines of text")
-    elif field_type == 'dropdown':
-        instructions.append("Select one option from the dropdown list")
-    elif field_type == 'multi-select':
-        instructions.append("Select multiple options from the list (hold Ctrl/Cmd to select multiple)")
-    elif field_type == 'checkboxes':
-        instructions.append("Check one or more boxes")
-    
-    if required:
-        instructions.append("This field is required and must be filled")
-    else:
-        instructions.append("This field is optional")
+    instructions = [FIELD_TYPE_INSTRUCTIONS.get(field_type), REQUIRED_INSTRUCTIONS[bool(required)]]
     
     # Add specific instructions based on field content
-    placeholder = field_def.get('placeholder', '')
     if placeholder:
         instructions.append(f"Use the placeholder as guidance: '{placeholder}'")
     
-    return ". ".join(instructions) + "."
+    return ". ".join(i for i in instructions if i) + "."
 
 def generate_word_document(config, fields, data):
     """Generate complete Word document."""
     
-    doc = Document()
-    setup_document_styles(doc)
+    doc = new_styled_document()
+    styles = get_document_styles(doc)
     
     # Document title
     title = doc.add_paragraph(config['name'])
-    title.style = 'Title'
+    title.style = styles['Title']
     title.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
     
     # Document description
     if config.get('description'):
         desc_p = doc.add_paragraph(config['description'])
-        desc_p.style = 'Field Description'
+        desc_p.style = styles['Field Description']
         desc_p.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
         
     doc.add_paragraph()  # Add spacing
     
     # Overview section
     overview = doc.add_paragraph("Overview")
-    overview.style = 'Heading 1'
-    
-    overview_text = f"""This document outlines the form fields and options for the "{config['name']}" template. 
-Each field is numbered and includes information about its type, available options, and instructions for completion.
-
-Template Information:
-• Name: {config['name']}
-• Labels: {config.get('labels', 'N/A')}
-• Total Fields: {len([f for f in fields if f['field_type'] != 'markdown'])}
-• Required Fields: {len([f for f in fields if f['required'].lower() == 'true' and f['field_type'] != 'markdown'])}
-"""
-    
-    p = doc.add_paragraph(overview_text)
-    p.style = 'Field Description'
+    overview.style = styles['Heading 1']
+    
+    # Count input fields and required fields in a single pass
+    total_fields = required_fields = 0
+    for f in fields:
+        if f['field_type'] == 'markdown':
+            continue
+        total_fields += 1
+        if f['required']:
+            required_fields += 1
+    
+    overview_lines = [
+        f"This document outlines the form fields and options for the \"{config['name']}\" template.",
+        "Each field is numbered and includes information about its type, available options, and instructions for completion.",
+        "",
+        "Template Information:",
+        f"• Name: {config['name']}",
+        f"• Labels: {config.get('labels', 'N/A')}",
+        f"• Total Fields: {total_fields}",
+        f"• Required Fields: {required_fields}",
+    ]
+    
+    # One run per line, joined by explicit line breaks
+    p = add_styled_paragraph(doc, styles['Field Description'])
+    run = p.add_run(overview_lines[0])
+    for line in overview_lines[1:]:
+        run.add_break()
+        run = p.add_run(line)
     
     doc.add_paragraph()
     
     # Fields section
     fields_header = doc.add_paragraph("Form Fields")
-    fields_header.style = 'Heading 1'
+    fields_header.style = styles['Heading 1']
     
     field_number = 1
     for field_def in fields:
@@ -282,7 +405,7 @@ Template Information:
         if field_def['field_id'] not in data and field_def['field_id'] in config:
             data[field_def['field_id']] = config[field_def['field_id']]
         
-        add_field_to_document(doc, field_def, data, field_number)
+        add_field_to_document(doc, field_def, data, field_number, styles)
         
         # Only increment counter for non-markdown fields
         if field_def['field_type'] != 'markdown':
@@ -291,7 +414,7 @@ Template Information:
     # Footer section
     doc.add_page_break()
     footer_header = doc.add_paragraph("Additional Information")
-    footer_header.style = 'Heading 1'
+    footer_header.style = styles['Heading 1']
     
     footer_text = """Completion Guidelines:
 • Fields marked with an asterisk (*) are required
@@ -303,20 +426,59 @@ Template Information:
 For technical support or questions about this template, please refer to the project documentation or contact the development team."""
     
     p = doc.add_paragraph(footer_text)
-    p.style = 'Field Description'
+    p.style = styles['Field Description']
     
     return doc
 
-def process_template_pair(template_name, csv_file, py_file, output_dir):
-    """Process a single template pair and generate Word document."""
+@contextmanager
+def _fast_zip_compression():
+    """Have python-docx write its zip package with the fastest deflate level."""
+    original = phys_pkg.ZipFile
+    phys_pkg.ZipFile = partial(ZipFile, compresslevel=1)
+    try:
+        yield
+    finally:
+        phys_pkg.ZipFile = original
+
+def save_document(doc, output_file, fast=False):
+    """Save a document, optionally trading file size for save speed."""
+    with open(output_file, 'wb', buffering=SAVE_BUFFER_SIZE) as f:
+        if fast:
+            with _fast_zip_compression():
+                doc.save(f)
+        else:
+            doc.save(f)
+
+def is_up_to_date(output_file, *inputs):
+    """Check whether output_file exists and is newer than every input file."""
+    try:
+        output_mtime = output_file.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return all(Path(path).stat().st_mtime < output_mtime for path in inputs)
+
+def process_template_pair(template_name, csv_file, py_file, output_dir, fast=False, force=False):
+    """
+    Process a single template pair and generate Word document.
+    
+    Returns a (success, error) tuple so results can be collected from worker
+    processes; error is None unless generation raised. With ``fast`` the
+    .docx is compressed at the lowest deflate level. An existing guide newer
+    than both inputs is left alone unless ``force`` is set.
+    """
     
     print(f"Processing {template_name}...")
     
+    output_file = output_dir / f"{template_name}_guide.docx"
+    if not force and is_up_to_date(output_file, csv_file, py_file):
+        print(f"    Up-to-date: {output_file.name}")
+        return True, None
+    
     try:
         config, data = load_template_data(py_file)
         if not config:
             print(f"    No TEMPLATE_CONFIG found")
-            return False
+            return False, None
         
         print(f"    Loaded: {config['name']}")
         
@@ -326,16 +488,18 @@ def process_template_pair(template_name, csv_file, py_file, output_dir):
         doc = generate_word_document(config, fields, data)
         
         # Save the document
-        output_file = output_dir / f"{template_name}_guide.docx"
-        doc.save(str(output_file))
+        save_document(doc, output_file, fast=fast)
         
         print(f"    Generated {template_name}_guide.docx")
-        return True
+        return True, None
         
     except Exception as e:
         print(f"    Error: {e}")
-        failed_templates.append(f"{template_name}: {str(e)}")
-        return False
+        return False, f"{template_name}: {str(e)}"
+
+def _process_template_job(job):
+    """Unpack a (template_name, csv_file, py_file, output_dir, fast, force) job for a worker process."""
+    return process_template_pair(*job)
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -343,6 +507,8 @@ def parse_arguments():
     parser.add_argument('-t', '--template-dir', type=Path, help='Template directory')
     parser.add_argument('-o', '--output-dir', type=Path, help='Output directory')
     parser.add_argument('--template', type=str, help='Generate guide for specific template')
+    parser.add_argument('--fast', action='store_true', help='Use fast, light compression when saving documents')
+    parser.add_argument('--force', action='store_true', help='Regenerate guides even if they are up-to-date')
     return parser.parse_args()
 
 def main():
@@ -365,7 +531,11 @@ def main():
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    csv_files = list(template_dir.glob('*.csv'))
+    # Read the directory once; .py lookups below are then set membership tests
+    with os.scandir(template_dir) as entries:
+        available = {entry.name for entry in entries
+                     if entry.is_file() and not entry.name.startswith('.')}
+    csv_files = [template_dir / name for name in sorted(available) if name.endswith('.csv')]
     
     if args.template:
         csv_files = [f for f in csv_files if f.stem == args.template]
@@ -376,17 +546,26 @@ def main():
     
     print(f"Processing {len(csv_files)} templates")
     
-    success_count = 0
+    jobs = []
     for csv_file in csv_files:
         template_name = csv_file.stem
         py_file = template_dir / f"{template_name}.py"
         
-        if py_file.exists():
-            if process_template_pair(template_name, csv_file, py_file, output_dir):
-                success_count += 1
+        if py_file.name in available:
+            jobs.append((template_name, csv_file, py_file, output_dir, args.fast, args.force))
         else:
             print(f"    Warning: No Python config file found for {template_name}")
     
+    # Templates are independent, so generate them in separate processes
+    success_count = 0
+    failed_templates = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for success, error in executor.map(_process_template_job, jobs):
+            if success:
+                success_count += 1
+            elif error:
+                failed_templates.append(error)
+    
     print(f"Results: {success_count}/{len(csv_files)} successful")
     
     if failed_templates:
@@ -30,6 +30,14 @@ from pathlib import Path
 import random
 import subprocess
 import re
+from functools import lru_cache
+from operator import itemgetter
+
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # GitHub reserved words that cannot be used in issue template options
 GITHUB_RESERVED_WORDS = {'None', 'none', 'True', 'true', 'False', 'false'}
@@ -40,10 +48,6 @@ DEFAULT_DROPDOWN_TITLE = "Detailed Guidance"
 # Indentation for YAML literal blocks
 YAML_INDENT = "        "  # 8 spaces for value content
 
-# Track failed templates: list of (name, error_message)
-failed = []
-
-
 def sanitize_option(option):
     """Replace GitHub reserved words with safe alternatives."""
     if option in GITHUB_RESERVED_WORDS:
@@ -122,11 +126,18 @@ def load_json_config(json_file):
         return json.load(f)
 
 
+@lru_cache(maxsize=None)
+def _compile_template_source(py_file, mtime):
+    """Compile a template Python file, cached on its path and modification time."""
+    with open(py_file, 'r', encoding='utf-8') as f:
+        return compile(f.read(), py_file, 'exec')
+
+
 def load_template_data(py_file):
     """Load data from Python file."""
     namespace = {}
-    with open(py_file, 'r', encoding='utf-8') as f:
-        exec(f.read(), namespace)
+    code = _compile_template_source(str(py_file), os.path.getmtime(py_file))
+    exec(code, namespace)
     
     config = namespace.get('TEMPLATE_CONFIG', {})
     data = namespace.get('DATA', {})
@@ -135,13 +146,25 @@ def load_template_data(py_file):
 
 def load_csv_fields(csv_file):
     """Load field definitions from CSV."""
-    fields = []
     with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader)
+        width = len(header)
+        order_index = header.index('field_order')
+        required_index = header.index('required')
+        
+        fields = []
         for row in reader:
-            fields.append(row)
+            if not row:
+                continue
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            field = dict(zip(header, row))
+            field['field_order'] = int(row[order_index])
+            field['required'] = row[required_index].strip().lower() == 'true'
+            fields.append(field)
     
-    fields.sort(key=lambda x: int(x['field_order']))
+    fields.sort(key=itemgetter('field_order'))
     
     issue_kind_field = None
     collaborators_field = None
@@ -194,6 +217,87 @@ def build_description_with_guidance(base_description, field_id, field_type, conf
     return description
 
 
+# Rendered dropdown option blocks, keyed by the option structure they were built from
+_rendered_options = {}
+
+
+def _build_option_lines(options_type, source_data, field_id):
+    """Build the YAML option lines for a dropdown data source."""
+    lines = []
+    
+    if options_type == 'dict_keys':
+        for key in sorted(source_data.keys(), key=str.lower):
+            safe_key = sanitize_option(key)
+            lines.append(f"        - \"{safe_key}\"")
+    
+    elif options_type == 'list':
+        seen = set()
+        for item in sorted(source_data, key=lambda x: str(x).lower()):
+            safe_item = sanitize_option(item)
+            if safe_item not in seen:
+                lines.append(f"        - \"{safe_item}\"")
+                seen.add(safe_item)
+
+    elif options_type in ['dict_multiple']:
+        seen = set()
+        for key in sorted(source_data.keys(), key=str.lower):
+            safe_key = sanitize_option(key)
+            if safe_key not in seen:
+                lines.append(f"        - \"{safe_key}\"")
+                seen.add(safe_key)
+
+    elif options_type == 'dict_with_extra':
+        seen = set()
+        for key in sorted(source_data.keys(), key=str.lower):
+            safe_key = sanitize_option(key)
+            if safe_key not in seen:
+                lines.append(f"        - \"{safe_key}\"")
+                seen.add(safe_key)
+        for extra in ["Open Source", "Registration Required", "Proprietary"]:
+            if extra not in seen:
+                lines.append(f"        - \"{extra}\"")
+                seen.add(extra)
+
+    elif options_type == 'list_with_na':
+        if field_id != 'issue_kind':
+            lines.append("        - \"Not specified\"")
+        seen = {'Not specified'}
+        for item in sorted(source_data, key=lambda x: str(x).lower()):
+            safe_item = sanitize_option(item)
+            if safe_item not in seen:
+                lines.append(f"        - \"{safe_item}\"")
+                seen.add(safe_item)
+    
+    return '\n'.join(lines)
+
+
+def render_options(options_type, source_data, field_id):
+    """
+    Render the YAML option lines for a dropdown, reusing previously rendered blocks.
+    
+    Many fields (and templates) share the same option source, so the rendered
+    block is cached on the options type and the source's items. Item types are
+    part of the key, since equal values such as 1 and True render differently.
+    """
+    if not isinstance(source_data, dict):
+        # Read one-shot iterables (e.g. generators) once, for both the key and the lines
+        try:
+            source_data = list(source_data)
+        except TypeError:
+            return _build_option_lines(options_type, source_data, field_id)
+    
+    try:
+        items = source_data.keys() if isinstance(source_data, dict) else source_data
+        key = (options_type, tuple((type(item), item) for item in items), field_id == 'issue_kind')
+        hash(key)
+    except TypeError:
+        return _build_option_lines(options_type, source_data, field_id)
+    
+    if key not in _rendered_options:
+        _rendered_options[key] = _build_option_lines(options_type, source_data, field_id)
+    return _rendered_options[key]
+
+
 def generate_field_yaml(field_def, data, config):
     """Generate YAML for a single field."""
     
@@ -202,7 +306,7 @@ def generate_field_yaml(field_def, data, config):
     label = field_def['label']
     description = field_def['description']
     data_source = field_def['data_source']
-    required = field_def['required'].lower() == 'true'
+    required = field_def['required']
     placeholder = field_def['placeholder']
     options_type = field_def['options_type']
     default_value = field_def['default_value']
@@ -253,48 +357,9 @@ def generate_field_yaml(field_def, data, config):
                 options_available = True
                 yaml_lines.append("      options:")
                 
-                if options_type == 'dict_keys':
-                    for key in sorted(source_data.keys(), key=str.lower):
-                        safe_key = sanitize_option(key)
-                        yaml_lines.append(f"        - \"{safe_key}\"")
-                
-                elif options_type == 'list':
-                    seen = set()
-                    for item in sorted(source_data, key=lambda x: str(x).lower()):
-                        safe_item = sanitize_option(item)
-                        if safe_item not in seen:
-                            yaml_lines.append(f"        - \"{safe_item}\"")
-                            seen.add(safe_item)
-
-                elif options_type in ['dict_multiple']:
-                    seen = set()
-                    for key in sorted(source_data.keys(), key=str.lower):
-                        safe_key = sanitize_option(key)
-                        if safe_key not in seen:
-                            yaml_lines.append(f"        - \"{safe_key}\"")
-                            seen.add(safe_key)
-
-                elif options_type == 'dict_with_extra':
-                    seen = set()
-                    for key in sorted(source_data.keys(), key=str.lower):
-                        safe_key = sanitize_option(key)
-                        if safe_key not in seen:
-                            yaml_lines.append(f"        - \"{safe_key}\"")
-                            seen.add(safe_key)
-                    for extra in ["Open Source", "Registration Required", "Proprietary"]:
-                        if extra not in seen:
-                            yaml_lines.append(f"        - \"{extra}\"")
-                            seen.add(extra)
-
-                elif options_type == 'list_with_na':
-                    if field_id != 'issue_kind':
-                        yaml_lines.append("        - \"Not specified\"")
-                    seen = {'Not specified'}
-                    for item in sorted(source_data, key=lambda x: str(x).lower()):
-                        safe_item = sanitize_option(item)
-                        if safe_item not in seen:
-                            yaml_lines.append(f"        - \"{safe_item}\"")
-                            seen.add(safe_item)
+                options_block = render_options(options_type, source_data, field_id)
+                if options_block:
+                    yaml_lines.append(options_block)
         
         if not options_available:
             print(f"    ⚠️  WARNING: No options available for dropdown field '{field_id}' (data_source: '{data_source}')")
@@ -342,25 +407,35 @@ body:
 def validate_yaml(content):
     """Validate YAML syntax."""
     try:
-        parsed = yaml.safe_load(content)
+        parsed = yaml.load(content, Loader=YamlLoader)
         return isinstance(parsed, dict) and 'name' in parsed and 'body' in parsed
     except Exception as e:
         return False, str(e)
     return True, None
 
 
-def check_template_files(template_name, template_dir):
-    """Check that all required files exist for a template."""
+def check_template_files(template_name, template_dir, available=None):
+    """
+    Check that all required files exist for a template.
+    
+    ``available`` is an optional set of file names already read from
+    ``template_dir``; when given it is used instead of a stat per file.
+    """
     csv_file = template_dir / f"{template_name}.csv"
     py_file = template_dir / f"{template_name}.py"
     json_file = template_dir / f"{template_name}.json"
     
+    if available is None:
+        exists = lambda path: path.exists()
+    else:
+        exists = lambda path: path.name in available
+    
     missing = []
-    if not csv_file.exists():
+    if not exists(csv_file):
         missing.append(f"{template_name}.csv")
-    if not py_file.exists():
+    if not exists(py_file):
         missing.append(f"{template_name}.py")
-    if not json_file.exists():
+    if not exists(json_file):
         missing.append(f"{template_name}.json")
     
     if missing:
@@ -370,8 +445,15 @@ def check_template_files(template_name, template_dir):
     return csv_file, py_file, json_file
 
 
-def process_template(template_name, csv_file, py_file, json_file, output_dir):
-    """Process a single template from its three source files."""
+def process_template(template_name, csv_file, py_file, json_file, output_dir, failed=None):
+    """
+    Process a single template from its three source files.
+    
+    Failures are recorded as (name, error_message) tuples in ``failed`` when
+    a list is supplied.
+    """
+    if failed is None:
+        failed = []
     
     print(f"Processing {template_name}...")
     
@@ -397,7 +479,7 @@ def process_template(template_name, csv_file, py_file, json_file, output_dir):
         yaml_content = generate_template_yaml(config, fields, data)
         
         try:
-            parsed = yaml.safe_load(yaml_content)
+            parsed = yaml.load(yaml_content, Loader=YamlLoader)
             if not (isinstance(parsed, dict) and 'name' in parsed and 'body' in parsed):
                 failed.append((template_name, "Invalid YAML structure"))
                 print(f"    ✗ Invalid YAML structure")
@@ -453,7 +535,12 @@ def main():
     
     output_dir.mkdir(exist_ok=True)
     
-    csv_files = list(template_dir.glob('*.csv'))
+    # Read the directory once; file pairing below is done against this set
+    with os.scandir(template_dir) as entries:
+        available = {entry.name for entry in entries
+                     if entry.is_file() and not entry.name.startswith('.')}
+    
+    csv_files = [template_dir / name for name in sorted(available) if name.endswith('.csv')]
     
     if args.template:
         csv_files = [f for f in csv_files if f.stem == args.template]
@@ -466,20 +553,21 @@ def main():
     print("-" * 40)
     
     created = []
+    failed = []
     success_count = 0
     skipped_count = 0
     
     for csv_file in csv_files:
         template_name = csv_file.stem
         
-        files = check_template_files(template_name, template_dir)
+        files = check_template_files(template_name, template_dir, available)
         if files is None:
             skipped_count += 1
             continue
         
         csv_file, py_file, json_file = files
         
-        if process_template(template_name, csv_file, py_file, json_file, output_dir):
+        if process_template(template_name, csv_file, py_file, json_file, output_dir, failed):
             success_count += 1
             created.append(template_name)
     
@@ -557,20 +645,31 @@ The following forms are available for this repository, and can be used to add or
 
 
 # Label management
-try:
-    existing = subprocess.run(
-        ["gh", "label", "list", "--json", "name"],
-        capture_output=True,
-        text=True
-    )
-    existing_labels = [l["name"] for l in json.loads(existing.stdout)]
-except Exception as e:
-    print(f"Note: Could not fetch existing labels: {e}")
-    existing_labels = []
+# Existing labels are fetched on first use so that importing the module, --help
+# and early exits do not pay for a `gh` round-trip.
+existing_labels = None
+
+
+def get_existing_labels():
+    """Return the repository's label names, fetching them once from GitHub."""
+    global existing_labels
+    if existing_labels is None:
+        try:
+            existing = subprocess.run(
+                ["gh", "label", "list", "--json", "name"],
+                capture_output=True,
+                text=True
+            )
+            existing_labels = [l["name"] for l in json.loads(existing.stdout)]
+        except Exception as e:
+            print(f"Note: Could not fetch existing labels: {e}")
+            existing_labels = []
+    return existing_labels
 
 
 def makelabel(config):
     """Create GitHub labels if they don't exist."""
+    existing_labels = get_existing_labels()
     for label in config.get('labels', []):
         if label in existing_labels:
             continue
@@ -11,19 +11,27 @@ Uses shared utilities from template_utils.py.
 
 import subprocess
 import yaml
-import glob, os, json
-from urllib.parse import urlencode
-from typing import OrderedDict
+import os, json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
 from tqdm import tqdm
 
+# orjson is optional; it parses the data files several times faster
+try:
+    import orjson as fast_json
+except ImportError:
+    fast_json = json
+
 # Import shared utilities
 from .template_utils import (
     get_repo_info,
     get_folders_from_branch,
     get_json_files_from_branch,
-    get_file_content_from_branch,
+    get_file_contents_from_branch,
+    clear_branch_cache,
     get_template_fields_and_options,
     find_matching_option,
+    build_option_index,
     extract_value,
     generate_prefill_link,
     generate_prefill_links_for_folder,
@@ -42,6 +50,12 @@ CONTRIBUTING_FILE = '.github/CONTRIBUTING.md'
 DESCRIPTION_FILE = '.github/description.md'
 ISSUES_FILE = '.github/issues.md'
 
+MODIFICATIONS_HEADER = '''
+## 2. Modifying or reusing existing entries
+
+The following links will open pre-filled GitHub issues with content from the selected files. These can be used to update entries or make new ones. 
+'''
+
 
 def get_template_categories():
     """Get categories from issue templates (CSV files in GEN_ISSUE_TEMPLATE or YAML in ISSUE_TEMPLATE)."""
@@ -50,43 +64,57 @@ def get_template_categories():
     # First try GEN_ISSUE_TEMPLATE (source of truth)
     gen_template_dir = ".github/GEN_ISSUE_TEMPLATE"
     if os.path.exists(gen_template_dir):
-        for csv_file in glob.glob(f"{gen_template_dir}/*.csv"):
-            name = os.path.basename(csv_file).replace('.csv', '')
-            # Skip general_issue as it's not an entity type
-            if name not in ['general_issue']:
-                categories.append(name)
+        with os.scandir(gen_template_dir) as entries:
+            for entry in entries:
+                # Skip directories and hidden files (editor lockfiles, macOS resource forks)
+                if not (entry.is_file() and entry.name.endswith('.csv')) or entry.name.startswith('.'):
+                    continue
+                name = entry.name[:-len('.csv')]
+                # Skip general_issue as it's not an entity type
+                if name not in ['general_issue']:
+                    categories.append(name)
     
     # Fallback to ISSUE_TEMPLATE if no GEN_ISSUE_TEMPLATE
     if not categories:
         issue_template_dir = ".github/ISSUE_TEMPLATE"
         if os.path.exists(issue_template_dir):
-            for yml_file in glob.glob(f"{issue_template_dir}/*.yml"):
-                name = os.path.basename(yml_file).replace('.yml', '')
-                # Skip config.yml and general_issue
-                if name not in ['config', 'general_issue']:
-                    categories.append(name)
+            with os.scandir(issue_template_dir) as entries:
+                for entry in entries:
+                    # Skip directories and hidden files (editor lockfiles, macOS resource forks)
+                    if not (entry.is_file() and entry.name.endswith('.yml')) or entry.name.startswith('.'):
+                        continue
+                    name = entry.name[:-len('.yml')]
+                    # Skip config.yml and general_issue
+                    if name not in ['config', 'general_issue']:
+                        categories.append(name)
     
     return sorted(categories)
 
 
-# Fetch from origin (but don't fail if it doesn't work)
-try:
-    subprocess.run(
-        ["git", "fetch", "origin"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-    print(f"Fetched from origin (including {DATA_BRANCH} branch)")
-except:
-    print_red("Could not fetch from origin, using local files only")
+def fetch_origin():
+    """Fetch from origin (but don't fail if it doesn't work)."""
+    try:
+        subprocess.run(
+            ["git", "fetch", "origin"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=30
+        )
+        print(f"Fetched from origin (including {DATA_BRANCH} branch)")
+        # Listings cached before this fetch would now be stale
+        clear_branch_cache()
+    except:
+        print_red("Could not fetch from origin, using local files only")
 
 
-def process_category(category, repo_url, repo_name):
+def process_category(category, repo_url, repo_name, show_progress=True):
     '''
     Process a category (template) and generate modification links if data exists.
     
-    Uses the shared utility functions for link generation.
+    Uses the shared utility functions for link generation. Pass
+    show_progress=False to hide the per-file progress bar, e.g. when several
+    categories are processed at once.
     '''
     
     display_name = category.replace('_', ' ').title()
@@ -105,31 +133,36 @@ def process_category(category, repo_url, repo_name):
     if not ids:
         print_red(f"No template found for {category}")
         return None
+    
+    # Normalize each dropdown's options once rather than for every file
+    option_index = {key: build_option_index(options) for key, options in dropdown_options.items()}
 
+    template_file = f"{category}.yml"
+    issue_url = f'{repo_url}/issues/new?'
+    # Parameter names are the same for every file, so quote them once
+    quoted_keys = {key: quote_plus(str(key)) for key in ('template', 'title', 'issue_kind', *ids)}
     urls = []
 
-    for filepath in tqdm(json_files, desc=category):
-        print(f"Processing file: {filepath}")
-        
-        # Get file content from branch
-        content = get_file_content_from_branch(filepath, DATA_BRANCH)
+    contents = get_file_contents_from_branch(json_files, DATA_BRANCH)
+    for filepath, content in tqdm(zip(json_files, contents), total=len(json_files), desc=category,
+                                  disable=not show_progress):
         if not content:
             continue
             
         try:
-            jd = json.loads(content)
+            jd = fast_json.loads(content)
         except Exception as e:
             print_red(f"Error parsing {filepath}: {e}")
             continue
 
-        match = OrderedDict()
-        
-        match['template'] = f"{category}.yml"
-        
         # Get the ID for the title
         item_id = jd.get('validation_key', jd.get('id', jd.get('@id', f'Unknown ({filepath})')))
-        match['title'] = f"Modify: {display_name}: {item_id}"
-        match['issue_kind'] = '"Modify"'
+        
+        match = {
+            'template': template_file,
+            'title': f"Modify: {display_name}: {item_id}",
+            'issue_kind': '"Modify"',
+        }
         
         for key in ids:
             try:
@@ -141,18 +174,18 @@ def process_category(category, repo_url, repo_name):
                         # Multi-select: handle list of values
                         if isinstance(entry, str):
                             # Single value - find matching option
-                            matched = find_matching_option(entry, dropdown_options.get(key, []))
+                            matched = find_matching_option(entry, option_index.get(key))
                             entry = f'"{matched}"'
                         else:
                             # Multiple values - find matching options for each
                             matched_entries = []
                             for e in list(entry):
-                                matched = find_matching_option(e, dropdown_options.get(key, []))
+                                matched = find_matching_option(e, option_index.get(key))
                                 matched_entries.append(f'"{matched}"')
                             entry = ','.join(matched_entries)
                     elif key in dropdown:
                         # Single dropdown - find matching option
-                        matched = find_matching_option(entry, dropdown_options.get(key, []))
+                        matched = find_matching_option(entry, option_index.get(key))
                         entry = f'"{matched}"'
                     elif isinstance(entry, list): 
                         entry = ', '.join(str(e) for e in entry)
@@ -162,12 +195,10 @@ def process_category(category, repo_url, repo_name):
                 print_red(f"Error processing {filepath} [{key}]: {ex}")
                 continue
 
-        query_string = f'{repo_url}/issues/new?' + urlencode(match)
-        print(query_string)
-        
+        query_string = issue_url + '&'.join(
+            f'{quoted_keys[key]}={quote_plus(str(value))}' for key, value in match.items()
+        )
         mdlink = "- [" + str(item_id) + "](" + query_string + ")\n"
-        print(mdlink)
-        
         urls.append(mdlink)
     
     if not urls:
@@ -197,6 +228,8 @@ def read_file_if_exists(filepath):
 
 
 def main():
+    fetch_origin()
+    
     # Get repository info
     repo_info = get_repo_info()
     if repo_info[0] is None:
@@ -219,44 +252,46 @@ def main():
     all_categories = sorted(set(categories + data_folders))
     print(f"All categories to process: {all_categories}")
     
-    # Build modification links content
-    modifications_entries = []
-    for category in all_categories:
-        print(f"\nProcessing category: {category}")
-        entry = process_category(category, repo_url, repo_name)
-        if entry:
-            modifications_entries.append(entry)
-    
-    # Start building CONTRIBUTING.md
-    contributing_content = ""
-    
-    # 1. Add description.md content (unchanged)
-    description_content = read_file_if_exists(DESCRIPTION_FILE)
-    if description_content:
-        contributing_content += description_content
-        if not contributing_content.endswith('\n'):
-            contributing_content += '\n'
-    
-    # 2. Add issues.md content (unchanged)
-    issues_content = read_file_if_exists(ISSUES_FILE)
-    if issues_content:
-        contributing_content += issues_content
-        if not contributing_content.endswith('\n'):
-            contributing_content += '\n'
-    
-    # 3. Add modification links at the end
-    if modifications_entries:
-        contributing_content += f'''
-## 2. Modifying or reusing existing entries
-
-The following links will open pre-filled GitHub issues with content from the selected files. These can be used to update entries or make new ones. 
-'''
-        for entry in modifications_entries:
-            contributing_content += entry
+    # Write CONTRIBUTING.md as it is built, one category at a time, into a
+    # temporary file that only replaces the real one once everything succeeded
+    temp_file = CONTRIBUTING_FILE + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        try:
+            # 1. Add description.md and 2. issues.md content (unchanged)
+            for filepath in (DESCRIPTION_FILE, ISSUES_FILE):
+                content = read_file_if_exists(filepath)
+                if content:
+                    f.write(content)
+                    if not content.endswith('\n'):
+                        f.write('\n')
+            
+            # 3. Add modification links at the end
+            # Categories are processed concurrently (mostly waiting on git) but
+            # written in sorted order as each result becomes available. A single
+            # progress bar over categories replaces the per-file bars, which
+            # would overwrite each other when drawn from several threads.
+            has_entries = False
+            with ThreadPoolExecutor(max_workers=min(16, len(all_categories) or 1)) as executor:
+                entries = executor.map(
+                    lambda category: process_category(category, repo_url, repo_name, show_progress=False),
+                    all_categories
+                )
+                for category, entry in tqdm(zip(all_categories, entries), total=len(all_categories),
+                                            desc="Categories"):
+                    print(f"\nProcessing category: {category}")
+                    if not entry:
+                        continue
+                    
+                    if not has_entries:
+                        f.write(MODIFICATIONS_HEADER)
+                        has_entries = True
+                    f.write(entry)
+        except BaseException:
+            f.close()
+            os.remove(temp_file)
+            raise
     
-    # Write CONTRIBUTING.md
-    with open(CONTRIBUTING_FILE, 'w', encoding='utf-8') as f:
-        f.write(contributing_content)
+    os.replace(temp_file, CONTRIBUTING_FILE)
     print(f"\n✅ Output written to {CONTRIBUTING_FILE}")
 
 
@@ -11,8 +11,15 @@ import json
 import os
 import glob
 import yaml
+from functools import lru_cache
 from urllib.parse import urlencode
-from typing import Optional, Dict, List, Any, OrderedDict, Union
+from typing import Optional, Dict, Iterator, List, Any, OrderedDict, Union
+
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # Default branch for data files
 DATA_BRANCH = 'src-data'
@@ -52,6 +59,48 @@ def get_repo_info() -> tuple:
         return None, None, None
 
 
+def _branch_files_by_folder(branch: str) -> Dict[str, List[str]]:
+    """
+    Map each folder on a branch to the paths of the files directly inside it.
+    
+    The whole tree is listed with a single ``git ls-tree`` call, cached per
+    branch, instead of one call per folder. A failed listing is not cached.
+    """
+    try:
+        return _list_branch_tree(branch)
+    except subprocess.CalledProcessError:
+        return {}
+
+
+@lru_cache(maxsize=None)
+def _list_branch_tree(branch: str) -> Dict[str, List[str]]:
+    """List a branch's files grouped by folder; raises if git fails, so errors are not cached."""
+    result = subprocess.run(
+        ["git", "ls-tree", "-r", "-z", "--name-only", f"origin/{branch}"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    
+    files_by_folder = {}
+    for path in result.stdout.split('\0'):
+        if path:
+            folder = path.rpartition('/')[0]
+            files_by_folder.setdefault(folder, []).append(path)
+    
+    return files_by_folder
+
+
+def clear_branch_cache() -> None:
+    """
+    Forget cached branch listings, e.g. after a ``git fetch``.
+    
+    The folder and file listings are cached per branch for the life of the
+    process; call this to see changes fetched since the first listing.
+    """
+    _list_branch_tree.cache_clear()
+
+
 def get_folders_from_branch(branch: str = DATA_BRANCH) -> List[str]:
     """
     Get list of data folders from a specific git branch.
@@ -62,25 +111,12 @@ def get_folders_from_branch(branch: str = DATA_BRANCH) -> List[str]:
     Returns:
         List of folder names
     """
-    folders = []
     skip_folders = ['project', 'cmor', 'content_summaries', 'docs', 'summaries', 
                     '.git', '.github', '.src', '__pycache__']
     
-    try:
-        result = subprocess.run(
-            ["git", "ls-tree", "-d", "--name-only", f"origin/{branch}"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        for line in result.stdout.strip().split('\n'):
-            folder = line.strip()
-            if folder and folder not in skip_folders and not folder.startswith('.'):
-                folders.append(folder)
-                
-    except subprocess.CalledProcessError:
-        pass
+    top_level = {folder.split('/', 1)[0] for folder in _branch_files_by_folder(branch) if folder}
+    folders = [folder for folder in top_level
+               if folder not in skip_folders and not folder.startswith('.')]
     
     return sorted(folders)
 
@@ -96,25 +132,10 @@ def get_json_files_from_branch(folder: str, branch: str = DATA_BRANCH) -> List[s
     Returns:
         List of JSON file paths
     """
-    json_files = []
-    
-    try:
-        result = subprocess.run(
-            ["git", "ls-tree", "--name-only", f"origin/{branch}", f"{folder}/"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        for line in result.stdout.strip().split('\n'):
-            filename = line.strip()
-            if filename.endswith('.json') and 'graph.jsonld' not in filename:
-                json_files.append(filename)
-                
-    except subprocess.CalledProcessError:
-        pass
-    
-    return json_files
+    return [
+        filename for filename in _branch_files_by_folder(branch).get(folder.rstrip('/'), [])
+        if filename.endswith('.json') and 'graph.jsonld' not in filename
+    ]
 
 
 def get_file_content_from_branch(filepath: str, branch: str = DATA_BRANCH) -> Optional[str]:
@@ -140,14 +161,86 @@ def get_file_content_from_branch(filepath: str, branch: str = DATA_BRANCH) -> Op
         return None
 
 
+def get_file_contents_from_branch(filepaths: List[str], branch: str = DATA_BRANCH) -> Iterator[Optional[str]]:
+    """
+    Get the content of several files from a specific branch.
+    
+    All files are read through one ``git cat-file --batch`` process, rather
+    than starting a ``git show`` per file.
+    
+    Args:
+        filepaths: Paths to the files
+        branch: The git branch to check
+        
+    Yields:
+        File content as string, or None if not found, in the order given
+    """
+    process = subprocess.Popen(
+        ["git", "cat-file", "--batch"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        for filepath in filepaths:
+            try:
+                process.stdin.write(f"origin/{branch}:{filepath}\n".encode())
+                process.stdin.flush()
+                # "<sha> blob <size>", or "<name> missing" if there is no such file
+                header = process.stdout.readline().split()
+            except BrokenPipeError:
+                header = []
+            
+            if len(header) != 3:
+                yield None
+                continue
+            
+            # The object is always sent, so read it even if it is not a file
+            content = process.stdout.read(int(header[2]))
+            process.stdout.read(1)  # trailing newline
+            yield content.decode('utf-8') if header[1] == b'blob' else None
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        process.stdout.close()
+        process.wait()
+
+
 def normalize_value(val: Any) -> Optional[str]:
     """Normalize a value for comparison (lowercase, hyphens to underscores)."""
     if val is None:
         return None
-    return str(val).lower().replace('-', '_').replace(' ', '_')
+    return _normalize_text(str(val))
 
 
-def find_matching_option(value: str, options: List[str]) -> str:
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    """Normalize a string; cached since option and field values repeat heavily."""
+    return text.lower().replace('-', '_').replace(' ', '_')
+
+
+def build_option_index(options: List[str]) -> Dict[str, str]:
+    """
+    Map each dropdown option's normalized form to the option text.
+    
+    Build this once per field and pass it to find_matching_option in place
+    of the option list, to avoid normalizing every option on every lookup.
+    
+    Args:
+        options: List of available options
+        
+    Returns:
+        Dictionary of normalized option -> option (first option wins)
+    """
+    index = {}
+    for option in options:
+        index.setdefault(normalize_value(option), option)
+    return index
+
+
+def find_matching_option(value: str, options: Union[List[str], Dict[str, str]]) -> str:
     """
     Find the matching option from a list of dropdown options.
     
@@ -155,7 +248,7 @@ def find_matching_option(value: str, options: List[str]) -> str:
     
     Args:
         value: The value to match
-        options: List of available options
+        options: List of available options, or an index from build_option_index
         
     Returns:
         The exact option text if found, otherwise the original value
@@ -165,6 +258,9 @@ def find_matching_option(value: str, options: List[str]) -> str:
     
     normalized_value = normalize_value(value)
     
+    if isinstance(options, dict):
+        return options.get(normalized_value, value)
+    
     for option in options:
         if normalize_value(option) == normalized_value:
             return option
@@ -182,11 +278,15 @@ def extract_value(val: Any) -> Any:
     Returns:
         Extracted value (string or list of strings)
     """
+    # Plain strings are by far the most common field values
+    if type(val) is str:
+        return val
     if isinstance(val, list):
         return [extract_value(v) for v in val]
     if isinstance(val, dict):
         val = next(iter(val.values()))
-        return val.get('validation_key', val.get('@id'))
+        if isinstance(val, dict):
+            return val.get('validation_key', val.get('@id'))
     return val
 
 
@@ -194,19 +294,29 @@ def get_template_fields_and_options(folder: str) -> tuple:
     """
     Get field IDs, types, and dropdown options from the YAML issue template.
     
+    The template is read and parsed once per name; each call returns new
+    top-level containers, so callers may add or remove entries freely.
+    
     Args:
         folder: The template name (without extension)
         
     Returns:
         tuple: (field_ids, dropdown_fields, multi_select_fields, dropdown_options)
     """
+    ids, dropdown, multi, dropdown_options = _parse_template_fields(folder)
+    return set(ids), list(dropdown), list(multi), dict(dropdown_options)
+
+
+@lru_cache(maxsize=None)
+def _parse_template_fields(folder: str) -> tuple:
+    """Read and parse the YAML issue template for a name, cached per process."""
     template_name = f"{folder}.yml"
     dyaml = None
     
     # Try local file first
     try:
         with open(f".github/ISSUE_TEMPLATE/{template_name}", 'r') as f:
-            dyaml = yaml.safe_load(f)
+            dyaml = yaml.load(f, Loader=YamlLoader)
     except:
         pass
     
@@ -219,11 +329,11 @@ def get_template_fields_and_options(folder: str) -> tuple:
                 text=True,
                 check=True
             )
-            dyaml = yaml.safe_load(result.stdout)
+            dyaml = yaml.load(result.stdout, Loader=YamlLoader)
         except:
-            return set(), [], [], {}
+            return frozenset(), (), (), {}
     
-    ids = set([item['id'] for item in dyaml['body'] if 'id' in item])
+    ids = frozenset(item['id'] for item in dyaml['body'] if 'id' in item)
     dropdown = []
     multi = []
     dropdown_options = {}
@@ -239,7 +349,7 @@ def get_template_fields_and_options(folder: str) -> tuple:
                 if entry['attributes'].get('multiple', False):
                     multi.append(field_id)
 
-    return ids, dropdown, multi, dropdown_options
+    return ids, tuple(dropdown), tuple(multi), dropdown_options
 
 
 def load_template_config(template_name: str) -> Optional[Dict]:
@@ -437,6 +547,7 @@ def generate_prefill_links_for_folder(
     ids, dropdown, multi, dropdown_options = get_template_fields_and_options(template_name)
     if not ids:
         return []
+    option_index = {key: build_option_index(options) for key, options in dropdown_options.items()}
     
     # Default source config
     if source_config is None:
@@ -453,8 +564,8 @@ def generate_prefill_links_for_folder(
     yaml_template = f"{template_name}.yml"
     display_folder = folder.replace('_', ' ').title()
     
-    for filepath in json_files:
-        content = get_file_content_from_branch(filepath, branch)
+    contents = get_file_contents_from_branch(json_files, branch)
+    for filepath, content in zip(json_files, contents):
         if not content:
             continue
         
@@ -488,16 +599,16 @@ def generate_prefill_links_for_folder(
             
             if key in multi:
                 if isinstance(entry, str):
-                    matched = find_matching_option(entry, dropdown_options.get(key, []))
+                    matched = find_matching_option(entry, option_index.get(key))
                     entry = f'"{matched}"'
                 else:
                     matched_entries = []
                     for e in list(entry):
-                        matched = find_matching_option(e, dropdown_options.get(key, []))
+                        matched = find_matching_option(e, option_index.get(key))
                         matched_entries.append(f'"{matched}"')
                     entry = ','.join(matched_entries)
             elif key in dropdown:
-                matched = find_matching_option(entry, dropdown_options.get(key, []))
+                matched = find_matching_option(entry, option_index.get(key))
                 entry = f'"{matched}"'
             elif isinstance(entry, list):
                 entry = ', '.join(str(e) for e in entry)